@@ -1,5 +1,18 @@
-from autode.solvent.solvents import Solvent, ImplicitSolvent, get_solvent
+from autode.solvent.solvents import (
+    Solvent,
+    ImplicitSolvent,
+    get_solvent,
+    get_solvent_by_package_name,
+    find_solvents_in,
+)
 from autode.solvent.explicit_solvent import ExplicitSolvent
 
 
-__all__ = ["get_solvent", "Solvent", "ImplicitSolvent", "ExplicitSolvent"]
+__all__ = [
+    "get_solvent",
+    "get_solvent_by_package_name",
+    "find_solvents_in",
+    "Solvent",
+    "ImplicitSolvent",
+    "ExplicitSolvent",
+]
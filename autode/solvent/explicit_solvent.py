@@ -1,4 +1,5 @@
 import numpy as np
+from copy import deepcopy
 from typing import Optional, TYPE_CHECKING, Any, List
 from scipy.spatial import distance_matrix
 
@@ -124,6 +125,10 @@ class ExplicitSolvent(AtomCollection, Solvent):
 
         return False
 
+    def copy(self) -> "ExplicitSolvent":
+        """Return a copy of this solvent, including the atoms"""
+        return deepcopy(self)
+
     @property
     def is_implicit(self) -> bool:
         """Is this solvent implicit?
@@ -58,7 +58,7 @@ setup(
     include_package_data=True,
     package_data={
         "autode.transition_states": ["lib/*.txt"],
-        "autode.solvent": ["lib/*.xyz"],
+        "autode.solvent": ["lib/*.xyz", "lib/*.json"],
     },
     extras_require={"dev": ["black", "pre-commit"]},
     ext_modules=cythonize(extensions, language_level="3"),
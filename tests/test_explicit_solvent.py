@@ -126,6 +126,15 @@ def test_equality():
     assert solv1 == solv1
 
 
+def test_copy_does_not_share_atoms():
+    solv = ExplicitSolvent(solvent=water_mol(), num=2)
+    solv_copy = solv.copy()
+    assert solv_copy == solv
+
+    solv_copy.atoms[0].translate(1.0, 0.0, 0.0)
+    assert np.allclose(solv.atoms[0].coord, water_mol().atoms[0].coord)
+
+
 def test_solvate_with_molecule():
     solute = methane_mol()
 
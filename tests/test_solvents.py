@@ -1,6 +1,15 @@
+import os
+import pickle
+import subprocess
+import sys
 import pytest
 from autode.species import Molecule
-from autode.solvent import solvents, get_solvent
+from autode.solvent import (
+    solvents,
+    get_solvent,
+    get_solvent_by_package_name,
+    find_solvents_in,
+)
 from autode.wrappers.ORCA import orca
 from autode.exceptions import SolventNotFound
 
@@ -35,6 +44,8 @@ def test_get_solvent():
     assert water.smiles == "O"
     assert "h2o" in water.aliases
     assert "water" in water.aliases
+    assert isinstance(water.aliases, frozenset)
+    assert all(sys.intern(alias) is alias for alias in water.aliases)
     assert water.dielectric is not None
 
     with pytest.raises(SolventNotFound):
@@ -42,6 +53,7 @@ def test_get_solvent():
 
     assert water is not None
     assert water == get_solvent(solvent_name="h2o", kind="implicit")
+    assert water == get_solvent(solvent_name=" Water ", kind="implicit")
 
     # Must define the number of explicit solvent molecules to add
     with pytest.raises(ValueError):
@@ -56,7 +68,26 @@ def test_solvent_dielectric():
     water = solvents.get_solvent("water", kind="implicit")
     assert abs(water.dielectric - 78) < 1
 
+    # Dielectrics are matched independent of case
+    chloropentane = solvents.get_solvent("1-chloropentane", kind="implicit")
+    assert chloropentane.dielectric is not None
+
     assert solvents.ImplicitSolvent("X", "X", aliases=["X"]).dielectric is None
+    assert solvents.ImplicitSolvent("X", "X", dielectric=3.0).dielectric == 3.0
+
+    # The name takes priority, then the aliases in the order given
+    water = solvents.ImplicitSolvent("water", "O", aliases=["dcm", "thf"])
+    assert water.dielectric == 78.36
+    dcm = solvents.ImplicitSolvent("X", "X", aliases=["dcm", "thf", "acetone"])
+    assert dcm.dielectric == 8.93
+
+    # as can be any iterable of aliases, including a generator
+    aliases = (alias for alias in ["dcm"])
+    dcm = solvents.ImplicitSolvent("X", "X", aliases=aliases)
+    assert "dcm" in dcm.aliases and dcm.dielectric == 8.93
+
+    # Every solvent in the library has a dielectric
+    assert all(solvent.dielectric is not None for solvent in solvents.solvents)
 
 
 def test_unavailable_methods_for_implicit_solvents():
@@ -72,3 +103,141 @@ def test_unavailable_methods_for_explicit_solvents():
     solvent = get_solvent("water", kind="explicit", num=1)
     with pytest.raises(RuntimeError):
         solvent.to_explicit(num=2)  # already explicit
+
+
+def test_get_solvent_from_any_alias():
+    for solvent in solvents.solvents:
+        for alias in solvent.aliases:
+            assert get_solvent(alias.upper(), kind="implicit") is solvent
+
+
+def test_solvents_are_hashable():
+    water = get_solvent("water", kind="implicit")
+    assert water in {get_solvent("H2O", kind="implicit")}
+    assert hash(water) == hash(water.copy())
+    assert water != get_solvent("dcm", kind="implicit")
+    assert water != "water"
+
+
+def test_get_solvent_by_package_name():
+    water = get_solvent("water", kind="implicit")
+    assert get_solvent_by_package_name("orca", "Water") is water
+    assert get_solvent_by_package_name("G16", "Water") is water
+    dcm = get_solvent_by_package_name("xtb", "CH2Cl2")
+    assert dcm.name == "dichloromethane"
+
+    # The first solvent in the library is used for shared package names
+    assert get_solvent_by_package_name("qchem", "benzene").name == "benzene"
+
+    with pytest.raises(SolventNotFound):
+        _ = get_solvent_by_package_name("orca", "XXXX")
+
+    with pytest.raises(ValueError):
+        _ = get_solvent_by_package_name("not_a_package", "water")
+
+
+def test_solvent_unknown_package_name():
+    with pytest.raises(ValueError):
+        _ = solvents.ImplicitSolvent("X", "X", not_a_package="X")
+
+    solvent = solvents.ImplicitSolvent("X", "X", mopac="X")
+    assert solvent.mopac == "X" and solvent.orca is None
+
+
+def test_get_solvent_from_noisy_name():
+    water = get_solvent("water", kind="implicit")
+    assert get_solvent("Water (H2O)", kind="implicit") is water
+    ipa = get_solvent("2-propanol (IPA)", kind="implicit")
+    assert ipa.name == "2-propanol"
+
+    # Only a trailing parenthetical is ignored, so different compounds
+    # containing the name of a solvent in the library are not found
+    for name in (
+        "waterx",
+        "water/dcm",
+        "not water",
+        "1,1-dichloroethane",
+        "3-methyl-1-butanol",
+        "2-methyl-2-butanol",
+        "iso-propanol",
+        "t-butanol",
+        "methyl tert-butyl ether",
+        "n-propanol / i-propanol",
+    ):
+        with pytest.raises(SolventNotFound):
+            _ = get_solvent(name, kind="implicit")
+
+
+def test_implicit_solvents_have_no_instance_dict():
+    water = get_solvent("water", kind="implicit")
+    assert not hasattr(water, "__dict__")
+
+    with pytest.raises(AttributeError):
+        water.not_an_attribute = None
+
+
+def test_find_solvents_in_text():
+    found = find_solvents_in("A 1:1 mixture of DCM and water, then more H2O")
+    assert [solvent.name for solvent in found] == ["dichloromethane", "water"]
+
+    # Aliases must be whole words
+    assert find_solvents_in("waterproof") == []
+
+    # nor part of a larger hyphenated name or one with locants
+    for text in (
+        "1,1-dichloroethane",
+        "3-methyl-1-butanol",
+        "2-methyl-2-butanol",
+        "iso-propanol",
+        "t-butanol",
+        "non-water",
+    ):
+        assert find_solvents_in(text) == []
+
+    found = find_solvents_in("THF/water (H2O), then 1,2-dichloroethane.")
+    assert [solvent.name for solvent in found] == [
+        "thf",
+        "water",
+        "1,2-dichloroethane",
+    ]
+    found = find_solvents_in("DCM, water")
+    assert [solvent.name for solvent in found] == ["dichloromethane", "water"]
+
+
+def test_solvent_library_is_immutable():
+    assert solvents.solvents is solvents.solvents
+
+    with pytest.raises(AttributeError):
+        solvents.solvents.append(solvents.ImplicitSolvent("X", "X"))
+
+
+def test_solvent_pickle_round_trip():
+    water = get_solvent("water", kind="implicit")
+
+    loaded = pickle.loads(pickle.dumps(water))
+    assert loaded == water and hash(loaded) == hash(water)
+
+    # String hashes are salted per process, so must not be pickled
+    script = (
+        "import pickle, sys; from autode.solvent import get_solvent; "
+        "sys.stdout.buffer.write(pickle.dumps(get_solvent('water', 'implicit')))"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": "1"}
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+    loaded = pickle.loads(output.stdout)
+    assert loaded == water and hash(loaded) == hash(water)
+
+
+def test_solvent_dielectric_is_looked_up_on_first_use():
+    solvents._library.cache_clear()
+
+    dcm = solvents.ImplicitSolvent("X", "X", aliases=["dcm"])
+    assert solvents._library.cache_info().currsize == 0
+
+    assert dcm.dielectric == 8.93
+    assert solvents._library.cache_info().currsize == 1